@@ -4,6 +4,7 @@ FastAPI application server.
 
 import logging
 import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,6 +14,8 @@ from apps.v1.api.auth.view import router as auth_router
 from apps.v1.api.course.view import router as course_router
 from apps.v1.api.student.view import router as student_router
 from apps.v1.api.credentials.view import credentials_router
+from apps.v1.api.credentials.services.everycred_service import everycred_service
+from apps.v1.api.credentials.services.everycred_admin_service import everycred_admin_service
 from config.cors import get_cors_config
 from core.utils import constant_variable
 
@@ -51,10 +54,19 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             raise
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the pooled EveryCRED HTTP clients on shutdown."""
+    yield
+    await everycred_service.close()
+    await everycred_admin_service.close()
+
+
 app = FastAPI(
     title="LMS Use Case Demo",
     description="Created API for the LMS Use Case Pitch",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add request logging middleware (before CORS)
@@ -46,6 +46,8 @@ async def login_user_service(
 
         if not user:
             logger.warning(f"User with email {email} not found")
+            # Run a dummy bcrypt check so unknown emails take as long as wrong passwords
+            PasswordUtils().verify_password(plain_password=password, hashed_password="")
             return StandardResponse(
                 status=constant_variable.STATUS_FAIL,
                 status_code=constant_variable.HTTP_401_UNAUTHORIZED,
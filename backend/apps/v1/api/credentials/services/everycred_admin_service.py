@@ -3,25 +3,115 @@ Service for integrating with EveryCRED staging admin API for credential manageme
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
 import httpx
+import orjson
 
-from apps.v1.api.credentials.services.everycred_service import EveryCREDConfig
+from apps.v1.api.credentials.services.everycred_service import (
+    EveryCREDConfig,
+    create_client,
+    encode_body,
+    parse_response,
+    send_with_retry,
+)
 
 logger = logging.getLogger(__name__)
 
+# EveryCRED staging endpoints
+STAGING_API_URL = "https://stg-dcs-api.everycred.com/v1"
+CREDENTIALS_URL = f"{STAGING_API_URL}/credentials"
+SUBJECT_URL = f"{STAGING_API_URL}/subject"
+FIELD_URL = f"{STAGING_API_URL}/field"
+CRED_FIELDS_URL = f"{STAGING_API_URL}/cred_fields"
+ADMIN_SUBJECTS_URL = "https://stg-dcs-issuer.everycred.com/admin/subjects"
+
+# Optional field attributes forwarded only when they have a value
+OPTIONAL_FIELD_KEYS = ("description", "pattern", "value", "hint_text", "sample", "error_message")
+
+# Field listings are reused for this long unless a field is created meanwhile
+FIELDS_CACHE_TTL_S = 60.0
+FIELDS_CACHE_MAX_SIZE = 256
+
 
 class EveryCREDAdminService:
     """Service for interacting with EveryCRED staging admin API."""
     
     def __init__(self):
-        self.api_url = "https://stg-dcs-api.everycred.com/v1/credentials"
-        self.admin_api_url = "https://stg-dcs-issuer.everycred.com/admin/subjects"
-        self.subject_api_url = "https://stg-dcs-api.everycred.com/v1/subject"  # Staging API endpoint for subject creation
-        self.cred_fields_api_url = "https://stg-dcs-api.everycred.com/v1/field"  # Fixed: should be /v1/field not /v1/cred_fields
-        self.single_field_api_url = "https://stg-dcs-api.everycred.com/v1/field"
+        self.api_url = CREDENTIALS_URL
+        self.admin_api_url = ADMIN_SUBJECTS_URL
+        self.subject_api_url = SUBJECT_URL  # Staging API endpoint for subject creation
+        self.cred_fields_api_url = FIELD_URL  # Fixed: should be /v1/field not /v1/cred_fields
+        self.single_field_api_url = FIELD_URL
         self.config = EveryCREDConfig()
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._client: Optional[httpx.AsyncClient] = None
+        # (url, sorted params) -> (expires_at, parsed listing response)
+        self._fields_cache: Dict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client, created on first use so importing the service opens no pool."""
+        if self._client is None:
+            self._client = create_client(self.config)
+        return self._client
+
+    async def list_fields(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch a credential field listing, reusing a recent identical response.
+
+        Args:
+            url: Field listing endpoint
+            params: Query parameters (issuer_id, page, size, search, ...)
+
+        Returns:
+            Parsed listing response
+
+        Raises:
+            httpx.HTTPStatusError: If the listing request fails
+        """
+        key = (url, tuple(sorted(params.items())))
+        now = time.monotonic()
+        cached = self._fields_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        response = await send_with_retry(self.client, "GET", url, params=params)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+
+        if len(self._fields_cache) >= FIELDS_CACHE_MAX_SIZE:
+            self._fields_cache.clear()
+        self._fields_cache[key] = (now + FIELDS_CACHE_TTL_S, result)
+        return result
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to EveryCred staging API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full endpoint URL
+            payload: Request body data
+            params: Query parameters
+            
+        Returns:
+            Response data as dictionary
+            
+        Raises:
+            Exception: If request fails
+        """
+        try:
+            response = await send_with_retry(self.client, method, url, content=encode_body(payload), params=params)
+        except Exception as e:
+            logger.error(f"Error calling EveryCRED API: {str(e)}")
+            raise
+        return parse_response(response)
     
     async def get_course_credentials(
         self,
@@ -54,31 +144,12 @@ class EveryCREDAdminService:
             "issuer_id": issuer_id,
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.config.api_token}",
-            "Content-Type": "application/json",
-        }
-        
-        try:
-            logger.info("Fetching course credentials from EveryCred API")
-            logger.info(f"URL: {self.api_url}")
-            logger.info(f"Params: {params}")
-            
-            response = await self.client.request(
-                method="GET",
-                url=self.api_url,
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-        except Exception as e:
-            logger.error(f"Error calling EveryCRED API: {str(e)}")
-            raise
+        logger.info(
+            "Fetching course credentials from EveryCred API\n   URL: %s\n   Params: %s",
+            self.api_url,
+            params,
+        )
+        return await self._request("GET", self.api_url, params=params)
     
     async def create_subject(
         self,
@@ -115,6 +186,11 @@ class EveryCREDAdminService:
         if not group_id:
             raise ValueError("group_id is required")
         
+        # Get issuer_id from config (required query parameter)
+        issuer_id = self.config.issuer_id
+        if not issuer_id:
+            raise ValueError("issuer_id is required but not configured. Please set EVERYCRED_ISSUER_ID in environment variables.")
+        
         # Build request payload
         payload: Dict[str, Any] = {
             "name": name,
@@ -156,45 +232,17 @@ class EveryCREDAdminService:
         if field_edit_policies:
             payload["field_edit_policies"] = field_edit_policies
         
-        headers = {
-            "Authorization": f"Bearer {self.config.api_token}",
-            "Content-Type": "application/json",
-        }
+        logger.info(
+            "Creating subject in EveryCred staging API\n   URL: %s\n   Issuer ID: %s\n   Payload: %s",
+            self.subject_api_url,
+            issuer_id,
+            payload,
+        )
         
-        try:
-            # Get issuer_id from config (required query parameter)
-            issuer_id = self.config.issuer_id
-            if not issuer_id:
-                raise ValueError("issuer_id is required but not configured. Please set EVERYCRED_ISSUER_ID in environment variables.")
-            
-            # Add issuer_id as query parameter
-            url_with_params = f"{self.subject_api_url}?issuer_id={issuer_id}"
-            
-            logger.info("Creating subject in EveryCred staging API")
-            logger.info(f"URL: {url_with_params}")
-            logger.info(f"Payload keys: {list(payload.keys())}")
-            logger.info(f"Issuer ID: {issuer_id}")
-            logger.info(f"Full payload: {payload}")
-            
-            # Use the staging API endpoint for subject creation
-            response = await self.client.request(
-                method="POST",
-                url=url_with_params,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"Subject created successfully via {self.subject_api_url}")
-            return result
-                
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-        except Exception as e:
-            logger.error(f"Error calling EveryCRED API: {str(e)}")
-            raise
+        # issuer_id goes as a query parameter, encoded by httpx
+        result = await self._request("POST", self.subject_api_url, payload, params={"issuer_id": issuer_id})
+        logger.info(f"Subject created successfully via {self.subject_api_url}")
+        return result
     
     async def create_cred_fields(
         self,
@@ -230,34 +278,17 @@ class EveryCREDAdminService:
             "fields_list": fields_list
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.config.api_token}",
-            "Content-Type": "application/json",
-        }
+        logger.info(
+            "Creating credential fields in EveryCred staging API\n   URL: %s\n   Fields count: %d",
+            self.cred_fields_api_url,
+            len(fields_list),
+        )
         
-        try:
-            logger.info("Creating credential fields in EveryCred staging API")
-            logger.info(f"URL: {self.cred_fields_api_url}")
-            logger.info(f"Fields count: {len(fields_list)}")
-            
-            response = await self.client.request(
-                method="POST",
-                url=self.cred_fields_api_url,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"Credential fields created successfully. Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-        except Exception as e:
-            logger.error(f"Error calling EveryCRED API: {str(e)}")
-            raise
+        result = await self._request("POST", self.cred_fields_api_url, payload)
+        # New fields make every cached listing stale
+        self._fields_cache.clear()
+        logger.info(f"Credential fields created successfully. Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+        return result
     
     async def create_single_field(
         self,
@@ -300,11 +331,7 @@ class EveryCREDAdminService:
         }
         
         # Add optional fields only if they have values (not None)
-        optional_fields = [
-            "description", "pattern", "value", "hint_text", 
-            "sample", "error_message"
-        ]
-        for field in optional_fields:
+        for field in OPTIONAL_FIELD_KEYS:
             value = field_data.get(field)
             if value is not None and value != "":
                 cleaned_field_data[field] = value
@@ -319,53 +346,42 @@ class EveryCREDAdminService:
             "fields_list": [cleaned_field_data]
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.config.api_token}",
-            "Content-Type": "application/json",
-        }
+        # The payload already carries the cleaned field data
+        logger.info(
+            "Creating single credential field in EveryCred staging API\n   URL: %s\n   Payload: %s",
+            self.single_field_api_url,
+            payload,
+        )
         
-        try:
-            logger.info("Creating single credential field in EveryCred staging API")
-            logger.info(f"URL: {self.single_field_api_url}")
-            logger.info(f"Field data: {field_data}")
-            logger.info(f"Cleaned field data: {cleaned_field_data}")
-            logger.info(f"Payload: {payload}")
-            
-            response = await self.client.request(
-                method="POST",
-                url=self.single_field_api_url,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"Single credential field created successfully. Response: {result}")
-            
-            # Extract the single field from the response
-            # Response format: {"status": "success", "data": [{"id": 93, ...}], "message": "..."}
-            if isinstance(result, dict) and "data" in result:
-                data = result["data"]
-                if isinstance(data, list) and len(data) > 0:
-                    # Return the first field from the list with the full response structure
-                    return {
-                        "status": result.get("status", "success"),
-                        "data": data[0],  # Return the single field object
-                        "message": result.get("message", "Credential field created successfully!"),
-                    }
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-        except Exception as e:
-            logger.error(f"Error calling EveryCRED API: {str(e)}")
-            raise
+        result = await self._request("POST", self.single_field_api_url, payload)
+        self._fields_cache.clear()
+        logger.info(f"Single credential field created successfully. Response: {result}")
+        
+        # Extract the single field from the response
+        # Response format: {"status": "success", "data": [{"id": 93, ...}], "message": "..."}
+        if isinstance(result, dict) and "data" in result:
+            data = result["data"]
+            if isinstance(data, list) and len(data) > 0:
+                # Return the first field from the list with the full response structure
+                return {
+                    "status": result.get("status", "success"),
+                    "data": data[0],  # Return the single field object
+                    "message": result.get("message", "Credential field created successfully!"),
+                }
+        
+        return result
     
     async def close(self):
         """Close HTTP client."""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "EveryCREDAdminService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
 
 # Singleton instance
@@ -2,11 +2,13 @@
 Service for integrating with EveryCRED API for credential issuance.
 """
 
+import asyncio
 import logging
 import os
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import httpx
+import orjson
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -23,6 +25,24 @@ load_dotenv(env_path)
 
 logger = logging.getLogger(__name__)
 
+# All calls go to one EveryCRED host. Keep enough warm connections for
+# concurrent requests and hold them long enough that spaced-out calls
+# reuse the existing TCP+TLS session instead of reconnecting.
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=120.0)
+
+# Failed connection attempts are retried this many times for any method,
+# since the request never reached the server
+CONNECT_RETRIES = 3
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Idempotent GETs are retried on these statuses with exponential backoff
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+GET_RETRY_ATTEMPTS = 3
+GET_RETRY_BASE_DELAY_S = 0.2
+
+# Public verifier page; a credential's unique ID is appended to it
+VERIFIER_URL = "https://stg-dcs-verifier-in.everycred.com"
+
 
 class EveryCREDConfig:
     """Configuration for EveryCRED API."""
@@ -41,6 +61,98 @@ class EveryCREDConfig:
             return True
         return bool(self.api_url and self.api_token and self.issuer_id and self.subject_id)
 
+    def auth_headers(self) -> Dict[str, str]:
+        """Headers sent with every EveryCRED API request."""
+        return {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
+
+
+def create_client(config: EveryCREDConfig) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for EveryCRED API calls.
+
+    HTTP/2 lets concurrent calls to the same EveryCRED host share one TLS
+    connection. The API base URL and auth headers are set once here, so calls
+    pass a relative endpoint (absolute URLs are still sent as-is).
+
+    No custom transport is passed: httpx only applies HTTP(S)_PROXY/NO_PROXY
+    from the environment to the transports it builds itself. Connection
+    retries are handled by send_with_retry instead.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=POOL_LIMITS,
+        base_url=f"{config.api_url.rstrip('/')}/",
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers=config.auth_headers(),
+    )
+
+
+async def send_with_retry(client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Send a request, retrying connection failures and transient GET errors.
+
+    Failures to connect are retried for every method, as nothing was sent.
+    Error statuses are retried for GETs only, since retrying a POST could
+    create duplicates.
+
+    Returns:
+        The last response received; callers still check its status
+
+    Raises:
+        httpx.ConnectError, httpx.ConnectTimeout: If every connection attempt fails
+    """
+    attempts = GET_RETRY_ATTEMPTS if method == "GET" else 1
+    attempt = 0
+    connect_failures = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+        except CONNECT_ERRORS as e:
+            if connect_failures == CONNECT_RETRIES:
+                raise
+            delay = GET_RETRY_BASE_DELAY_S * 2**connect_failures
+            connect_failures += 1
+            logger.warning("EveryCRED %s %s failed to connect (%s), retrying in %.1fs", method, url, e, delay)
+            await asyncio.sleep(delay)
+            continue
+        attempt += 1
+        if response.status_code not in RETRY_STATUS_CODES or attempt == attempts:
+            return response
+        delay = GET_RETRY_BASE_DELAY_S * 2 ** (attempt - 1)
+        logger.warning("EveryCRED %s %s returned %s, retrying in %.1fs", method, url, response.status_code, delay)
+        await asyncio.sleep(delay)
+
+
+def encode_body(data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """
+    Serialize a request body with orjson.
+
+    The bytes are sent as content=, relying on the client's Content-Type
+    header, rather than letting httpx run json.dumps on every call.
+    """
+    return orjson.dumps(data) if data is not None else None
+
+
+def parse_response(response: httpx.Response) -> Dict[str, Any]:
+    """
+    Decode an EveryCRED response body, raising on a non-2xx status.
+
+    The body bytes are read once: parsed directly on success, decoded as text
+    only to build the error message otherwise.
+
+    Raises:
+        Exception: If the response status is not 2xx
+    """
+    content = response.content
+    if not response.is_success:
+        error_detail = content.decode("utf-8", "replace")
+        logger.error(f"EveryCRED API error: {response.status_code} - {error_detail}")
+        raise Exception(f"EveryCRED API error: {response.status_code} - {error_detail}")
+    return orjson.loads(content)
+
 
 class CredentialRequest(BaseModel):
     """Request model for issuing credentials."""
@@ -67,7 +179,14 @@ class EveryCREDService:
     
     def __init__(self):
         self.config = EveryCREDConfig()
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client, created on first use so importing the service opens no pool."""
+        if self._client is None:
+            self._client = create_client(self.config)
+        return self._client
     
     async def _make_request(
         self,
@@ -95,30 +214,22 @@ class EveryCREDService:
             logger.info(f"[MOCK] {method} {endpoint}")
             return self._mock_response(method, endpoint, data)
         
-        url = f"{self.config.api_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        headers = {
-            "Authorization": f"Bearer {self.config.api_token}",
-            "Content-Type": "application/json",
-        }
+        # Relative to the client's base_url
+        endpoint = endpoint.lstrip("/")
         
         try:
-            logger.info(f"Making {method} request to EveryCRED: {url}")
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
+            logger.info(f"Making {method} request to EveryCRED: {endpoint}")
+            response = await send_with_retry(
+                self.client,
+                method,
+                endpoint,
+                content=encode_body(data),
                 params=params,
             )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"EveryCRED API error: {e.response.status_code} - {error_detail}")
         except Exception as e:
             logger.error(f"Error calling EveryCRED API: {str(e)}")
             raise
+        return parse_response(response)
     
     def _mock_response(
         self,
@@ -159,6 +270,17 @@ class EveryCREDService:
         
         return {"status": "success", "data": {}, "message": "Mock response"}
     
+    @staticmethod
+    def _extract_id(response: Dict[str, Any]) -> Optional[int]:
+        """Return data.id (or data.record.id) from an EveryCRED response, if present."""
+        data = response.get("data")
+        if not isinstance(data, dict):
+            return None
+        if "id" in data:
+            return data["id"]
+        record = data.get("record")
+        return record.get("id") if isinstance(record, dict) else None
+    
     def _normalize_date(self, date_str: Optional[str]) -> Optional[str]:
         """
         Normalize date string to YYYY-MM-DD format expected by EveryCRED API.
@@ -264,13 +386,9 @@ class EveryCREDService:
         
         response = await self._make_request("POST", endpoint, data=payload, params=params)
         
-        # Extract record ID from response
-        if "data" in response:
-            data = response["data"]
-            if "id" in data:
-                return data["id"]
-            elif "record" in data and "id" in data["record"]:
-                return data["record"]["id"]
+        record_id = self._extract_id(response)
+        if record_id is not None:
+            return record_id
         
         raise Exception("Failed to extract record ID from EveryCRED response")
     
@@ -378,7 +496,7 @@ class EveryCREDService:
             credential_id = f"EC-{int(time.time())}-{random.randint(1000, 9999)}"
             return CredentialResponse(
                 credential_id=credential_id,
-                verification_url=f"https://stg-dcs-verifier-in.everycred.com/{credential_id}",
+                verification_url=f"{VERIFIER_URL}/{credential_id}",
                 status="issued",
                 issued_at=issue_date,
                 record_id=record_id,
@@ -390,7 +508,7 @@ class EveryCREDService:
         
         return CredentialResponse(
             credential_id=task_id,  # Use task_id temporarily
-            verification_url=f"https://stg-dcs-verifier-in.everycred.com/{task_id}",
+            verification_url=f"{VERIFIER_URL}/{task_id}",
             status="processing",
             issued_at=issue_date,
             record_id=record_id,
@@ -495,7 +613,15 @@ class EveryCREDService:
     
     async def close(self):
         """Close HTTP client."""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "EveryCREDService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
 
 # Singleton instance
@@ -3,16 +3,19 @@ API endpoints for credential management and EveryCRED integration.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 
 from apps.v1.api.credentials.services.everycred_service import (
+    VERIFIER_URL,
     everycred_service,
 )
 from apps.v1.api.credentials.services.everycred_admin_service import (
+    CRED_FIELDS_URL,
+    FIELD_URL,
     everycred_admin_service,
 )
 from config.db_config import get_async_db
@@ -93,6 +96,30 @@ class SubjectCreateSchema(BaseModel):
     field_edit_policies: Optional[List[FieldEditPolicySchema]] = None
 
 
+def _extract_field_list(result: Any) -> Tuple[List[Any], int]:
+    """
+    Pull the field list and total out of an EveryCred field listing response.
+
+    Handles { "data": { "list": [...], "total": n } }, { "data": [...] }
+    and a root-level { "list": [...], "total": n }.
+    """
+    if not isinstance(result, dict):
+        return [], 0
+    data = result.get("data", {})
+    if isinstance(data, dict) and "list" in data:
+        container = data
+    elif isinstance(data, list):
+        return data, len(data)
+    elif "list" in result:
+        container = result
+    else:
+        return [], 0
+    fields_list = container.get("list")
+    if not isinstance(fields_list, list):
+        fields_list = []
+    return fields_list, container.get("total", len(fields_list))
+
+
 @credentials_router.post("/issue")
 async def issue_credential(
     credential_data: IssueCredentialSchema,
@@ -273,7 +300,7 @@ async def get_credentials_list(
                 # EveryCRED verifier URL format: https://stg-dcs-verifier-in.everycred.com/{credential_unique_id}
                 verification_url = None
                 if credential_unique_id:
-                    verification_url = f"https://stg-dcs-verifier-in.everycred.com/{credential_unique_id}"
+                    verification_url = f"{VERIFIER_URL}/{credential_unique_id}"
                     logger.info(f"Constructed verification URL from credential_unique_id: {verification_url}")
                 else:
                     logger.warning(f"No credential_unique_id found for credential {idx}, cannot construct verification URL")
@@ -571,11 +598,6 @@ async def list_cred_fields(
         
         # Call EveryCred staging API to list fields
         # Use issuer_id = 15 as default
-        headers = {
-            "Authorization": f"Bearer {everycred_admin_service.config.api_token}",
-            "Content-Type": "application/json",
-        }
-        
         # Build query parameters with issuer_id = 15
         params = {
             "page": page,
@@ -587,39 +609,14 @@ async def list_cred_fields(
         
         # Call EveryCred API endpoint for listing fields
         # The endpoint should be /v1/cred_fields or similar
-        api_url = "https://stg-dcs-api.everycred.com/v1/cred_fields"
+        api_url = CRED_FIELDS_URL
         
         try:
-            response = await everycred_admin_service.client.get(
-                api_url,
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
-            result = response.json()
+            result = await everycred_admin_service.list_fields(api_url, params)
             
             logger.info(f"EveryCred API response: {result}")
             
-            # Extract fields from response
-            fields_list = []
-            total = 0
-            
-            if isinstance(result, dict):
-                if "data" in result:
-                    data = result["data"]
-                    if isinstance(data, dict) and "list" in data:
-                        fields_list = data.get("list", [])
-                        total = data.get("total", len(fields_list))
-                    elif isinstance(data, list):
-                        fields_list = data
-                        total = len(data)
-                elif "list" in result:
-                    fields_list = result.get("list", [])
-                    total = result.get("total", len(fields_list))
-                elif isinstance(result.get("data"), list):
-                    # Direct list in data
-                    fields_list = result.get("data", [])
-                    total = len(fields_list)
+            fields_list, total = _extract_field_list(result)
             
             logger.info(f"Fetched {len(fields_list)} fields from EveryCred API")
             
@@ -679,51 +676,22 @@ async def get_group_fields(
         logger.info(f"Fetching credential fields - search: {search}")
         
         # Call EveryCred field API with issuer_id=15
-        headers = {
-            "Authorization": f"Bearer {everycred_admin_service.config.api_token}",
-            "Content-Type": "application/json",
-        }
-        
         params = {
             "issuer_id": 15,
         }
         if search:
             params["search"] = search
         
-        api_url = "https://stg-dcs-api.everycred.com/v1/field"
+        api_url = FIELD_URL
         
         try:
-            response = await everycred_admin_service.client.get(
-                api_url,
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
-            result = response.json()
+            result = await everycred_admin_service.list_fields(api_url, params)
             
             logger.info(f"Field API response structure: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
             logger.info(f"Field API response (first 500 chars): {str(result)[:500]}")
             
-            # Extract fields from response
             # Response structure: { "status": "success", "data": { "list": [{ "id": 84, ... }], "total": 16, ... } }
-            fields_list = []
-            total = 0
-            
-            if isinstance(result, dict):
-                data = result.get("data", {})
-                
-                # Extract fields from data.list
-                if isinstance(data, dict) and "list" in data:
-                    fields_list = data.get("list", []) if isinstance(data.get("list"), list) else []
-                    total = data.get("total", len(fields_list))
-                elif isinstance(data, list):
-                    # If data is directly a list
-                    fields_list = data
-                    total = len(fields_list)
-                elif "list" in result:
-                    # If list is at root level
-                    fields_list = result.get("list", []) if isinstance(result.get("list"), list) else []
-                    total = result.get("total", len(fields_list))
+            fields_list, total = _extract_field_list(result)
             
             logger.info(f"Extracted {len(fields_list)} fields from field API response (total: {total})")
             
@@ -90,6 +90,7 @@ if __name__ == "__main__":
             "*.pyo",
         ],
         reload_delay=0.25,  # Add small delay to prevent rapid reloads
+        loop="auto",  # uvloop where installed (not on Windows), else asyncio
         log_level="info",
         access_log=True,
         use_colors=True,
@@ -42,17 +42,9 @@ async def get_current_user(
 
         logger.info("STEP 2: Verifying JWT token")
 
-        # Verify and decode token
-        payload = jwt_handler.verify_token(token)
-        user_id = payload.get("user_id")
-
-        if not user_id:
-            logger.error("Token does not contain user_id")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: no user_id found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Verify and decode token (raises 401 if it has no user_id)
+        claims = jwt_handler.extract_claims(token)
+        user_id = claims["user_id"]
 
         logger.info(f"STEP 3: Fetching user from database: {user_id}")
 
@@ -3,13 +3,15 @@ Helper utilities.
 """
 
 from datetime import datetime
+from functools import lru_cache
 
 import hashlib
-import json
 import secrets
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import uuid
 import bcrypt
+import orjson
+
 
 def generate_random_string(length: int = 32) -> str:
     """Generate random string."""
@@ -21,14 +23,31 @@ def hash_string(text: str) -> str:
     return hashlib.sha256(text.encode()).hexdigest()
 
 
+def fast_hash(text: str) -> str:
+    """Hash a string for non-security uses such as cache keys or dedup."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
 def sanitize_dict(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Sanitize dictionary by removing None values."""
+    """Sanitize dictionary by removing None values.
+
+    Returns ``data`` itself when it holds no None values.
+    """
+    if not any(v is None for v in data.values()):
+        return data
     return {k: v for k, v in data.items() if v is not None}
 
 
-def generate_uuid():
-    """Generate UUID string."""
-    return str(uuid.uuid4())
+def sanitize_dict_inplace(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove None values from a dictionary in place and return it."""
+    for key in [k for k, v in data.items() if v is None]:
+        del data[key]
+    return data
+
+
+def generate_uuid() -> str:
+    """Generate UUID string (32 hex characters, no hyphens)."""
+    return uuid.uuid4().hex
 
 
 def generate_temporary_password(length: int = 12) -> str:
@@ -47,12 +66,17 @@ def generate_temporary_password(length: int = 12) -> str:
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> bytes:
+    """bcrypt hash checked when there is no stored hash, to keep timing uniform."""
+    return bcrypt.hashpw(b"x", bcrypt.gensalt())
+
+
 class PasswordUtils:
     """This class is used to manage password management"""
 
-    def __init__(self):
-        # Using bcrypt directly instead of passlib for better compatibility
-        pass
+    # Stateless: bcrypt is used directly (instead of passlib) for compatibility
+    __slots__ = ()
 
     def hash_password(self, password: str) -> str:
         """
@@ -78,6 +102,10 @@ class PasswordUtils:
         Returns:
             Boolean value indicating if password matches
         """
+        if not hashed_password:
+            # Spend the same bcrypt work as a real check, without raising
+            bcrypt.checkpw(b"x", _dummy_password_hash())
+            return False
         try:
             # Verify password using bcrypt
             return bcrypt.checkpw(
@@ -86,100 +114,212 @@ class PasswordUtils:
         except Exception:
             return False
 
-class TypeCoercion:
-    """This class is used to coerce types"""
 
-    @staticmethod
-    def coerce_str(value: Any, default: Optional[str] = None) -> Optional[str]:
-        if value is None or value == "":
-            return default
-        if isinstance(value, str):
-            return value.strip() if value.strip() else default
-        return str(value) if value else default
+# Accepted spellings for coerce_bool (compared lowercased)
+_TRUE_STRINGS = frozenset({"y", "yes", "1", "true", "t"})
+_FALSE_STRINGS = frozenset({"n", "no", "0", "false", "f", ""})
+
+
+def coerce_str(value: Any, default: Optional[str] = None) -> Optional[str]:
+    if value is None:
+        return default
+    if value.__class__ is str or isinstance(value, str):
+        stripped = value.strip()
+        return stripped if stripped else default
+    if value == "":
+        return default
+    return str(value) if value else default
 
-    @staticmethod
-    def coerce_int(value: Any, default: Optional[int] = None) -> Optional[int]:
-        if value is None or value == "":
+
+def coerce_int(value: Any, default: Optional[int] = None) -> Optional[int]:
+    if value is None:
+        return default
+    cls = value.__class__
+    if cls is int:
+        return value
+    if cls is str or isinstance(value, str):
+        if not value or value.isspace():
             return default
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str):
-            try:
-                return int(float(value)) if value.strip() else default
-            except (ValueError, AttributeError):
-                return default
         try:
             return int(value)
-        except (ValueError, TypeError):
+        except ValueError:
+            pass
+        try:
+            return int(float(value))
+        except (ValueError, OverflowError):
             return default
+    if value == "":
+        return default
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return default
+
 
-    @staticmethod
-    def coerce_float(value: Any, default: Optional[float] = None) -> Optional[float]:
-        if value is None or value == "":
+def coerce_float(value: Any, default: Optional[float] = None) -> Optional[float]:
+    if value is None:
+        return default
+    cls = value.__class__
+    if cls is float:
+        return value
+    if cls is int:
+        return float(value)
+    if cls is str or isinstance(value, str):
+        if not value or value.isspace():
             return default
-        if isinstance(value, float):
-            return value
-        if isinstance(value, int):
-            return float(value)
-        if isinstance(value, str):
-            try:
-                return float(value) if value.strip() else default
-            except (ValueError, AttributeError):
-                return default
         try:
             return float(value)
-        except (ValueError, TypeError):
+        except ValueError:
             return default
+    if value == "":
+        return default
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
 
-    @staticmethod
-    def coerce_bool(value: Any, default: bool = False) -> bool:
-        if value is None or value == "":
+
+def coerce_bool(value: Any, default: bool = False) -> bool:
+    if value is None:
+        return default
+    cls = value.__class__
+    if cls is bool:
+        return value
+    if cls is str or isinstance(value, str):
+        if not value:
             return default
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            upper = value.upper().strip()
-            if upper in ("Y", "YES", "1", "TRUE", "T"):
-                return True
-            if upper in ("N", "NO", "0", "FALSE", "F", ""):
-                return False
-        if isinstance(value, (int, float)):
-            return bool(value)
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        return default
+    if value == "":
         return default
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return default
 
-    @staticmethod
-    def coerce_datetime(value: Any, default: Optional[datetime] = None) -> Optional[datetime]:
-        if value is None or value == "":
-            return default
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            try:
-                # Try parsing ISO format with timezone
-                if "+" in value or value.endswith("Z"):
-                    clean_value = value.split("+")[0].split("Z")[0]
-                    if "." in clean_value:
-                        clean_value = clean_value.split(".")[0]
-                    return datetime.fromisoformat(clean_value)
-                return datetime.fromisoformat(value)
-            except (ValueError, AttributeError):
-                return default
+
+def coerce_datetime(value: Any, default: Optional[datetime] = None) -> Optional[datetime]:
+    if value is None or value == "":
         return default
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            # fromisoformat parses offsets, "Z" and fractions in C (3.11+)
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return default
+        # Timezone-qualified values keep their wall-clock time, as naive
+        if parsed.tzinfo is not None:
+            return parsed.replace(tzinfo=None, microsecond=0)
+        return parsed
+    return default
 
 
-    @staticmethod
-    def coerce_list(value: Any, default: Optional[list] = None) -> list:
-        """
-        Coerce value to list. Accepts JSON strings, lists, or returns default/empty list.
-        """
-        if value is None:
+def coerce_list(value: Any, default: Optional[list] = None) -> list:
+    """
+    Coerce value to list. Accepts JSON strings, lists, or returns default/empty list.
+    """
+    if value is None:
+        return default if default is not None else []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        try:
+            parsed = orjson.loads(value)
+            return parsed if isinstance(parsed, list) else (default if default is not None else [])
+        except orjson.JSONDecodeError:
             return default if default is not None else []
-        if isinstance(value, list):
-            return value
-        if isinstance(value, str):
-            try:
-                parsed = json.loads(value)
-                return parsed if isinstance(parsed, list) else (default if default is not None else [])
-            except Exception:
-                return default if default is not None else []
-        return [value] if value else (default if default is not None else [])
\ No newline at end of file
+    return [value] if value else (default if default is not None else [])
+
+
+def coerce_column(values: Iterable[Any], kind: str, default: Any = None) -> List[Any]:
+    """
+    Coerce a column of values (one field across many rows) to a single type.
+
+    The scalar coercer is resolved once for the whole column, so bulk paths
+    avoid per-value method lookup. kind is one of: str, int, float, bool,
+    datetime, list.
+    """
+    coerce = _COLUMN_COERCERS.get(kind)
+    if coerce is None:
+        raise ValueError(f"Unsupported column type: {kind}")
+    return [coerce(value, default) for value in values]
+
+
+_COLUMN_COERCERS = {
+    "str": coerce_str,
+    "int": coerce_int,
+    "float": coerce_float,
+    "bool": coerce_bool,
+    "datetime": coerce_datetime,
+    "list": coerce_list,
+}
+
+# Python type -> coercer used by build_coercer
+_TYPE_COERCERS = {
+    str: coerce_str,
+    int: coerce_int,
+    float: coerce_float,
+    bool: coerce_bool,
+    datetime: coerce_datetime,
+    list: coerce_list,
+}
+
+
+def build_coercer(field_types: Dict[str, type]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that coerces a row dict to the given field types.
+
+    The function is generated once per field layout (and cached), with one
+    direct coerce_* call per field, so bulk paths applying the same schema to
+    many rows skip per-field type dispatch.
+
+    Args:
+        field_types: Mapping of field name to str, int, float, bool, datetime or list
+
+    Returns:
+        Callable taking a row dict and returning a new dict with coerced values
+    """
+    return _build_coercer(tuple(field_types.items()))
+
+
+@lru_cache(maxsize=128)
+def _build_coercer(fields: Tuple[Tuple[str, type], ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    namespace: Dict[str, Any] = {}
+    lines = ["def coerce_row(row):", "    get = row.get", "    return {"]
+    for index, (name, field_type) in enumerate(fields):
+        coercer = _TYPE_COERCERS.get(field_type)
+        if coercer is None:
+            raise ValueError(f"Unsupported field type for {name!r}: {field_type!r}")
+        namespace[f"_c{index}"] = coercer
+        lines.append(f"        {name!r}: _c{index}(get({name!r})),")
+    lines.append("    }")
+    exec(compile("\n".join(lines), "<build_coercer>", "exec"), namespace)
+    return namespace["coerce_row"]
+
+
+class TypeCoercion:
+    """This class is used to coerce types
+
+    Namespace over the module-level coerce_* functions; call those directly on
+    hot paths to skip the class attribute lookup.
+    """
+
+    coerce_str = staticmethod(coerce_str)
+    coerce_int = staticmethod(coerce_int)
+    coerce_float = staticmethod(coerce_float)
+    coerce_bool = staticmethod(coerce_bool)
+    coerce_datetime = staticmethod(coerce_datetime)
+    coerce_list = staticmethod(coerce_list)
+    coerce_column = staticmethod(coerce_column)
+    build_coercer = staticmethod(build_coercer)
@@ -2,13 +2,36 @@
 HTML to PDF conversion utilities.
 """
 
-from weasyprint import HTML
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
+
+# Font configuration shared by every render instead of being rebuilt per call
+_FONT_CONFIG = FontConfiguration()
+
+# WeasyPrint's font state is not thread-safe, so every render of the shared
+# font configuration holds this lock, whichever thread it runs on
+_RENDER_LOCK = threading.Lock()
+
+# Async renders queue on one worker instead of tying up several threads
+# that would only wait on _RENDER_LOCK
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html_to_pdf")
+
 
 def html_to_pdf(html_content: str) -> BytesIO:
     """Convert HTML content to PDF."""
     pdf_file = BytesIO()
-    HTML(string=html_content).write_pdf(pdf_file)
+    with _RENDER_LOCK:
+        HTML(string=html_content).write_pdf(pdf_file, font_config=_FONT_CONFIG)
     pdf_file.seek(0)
     return pdf_file
+
+
+async def html_to_pdf_async(html_content: str) -> BytesIO:
+    """Convert HTML content to PDF without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PDF_EXECUTOR, html_to_pdf, html_content)
@@ -1,18 +1,42 @@
 """JWT token handler utility."""
 
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple, TypedDict
 
+import jwt
 from fastapi import HTTPException, status
-from jose import jwt
-from jose.exceptions import ExpiredSignatureError, JWTError
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from config.env_config import settings
 
 
+# Maximum number of decoded tokens kept by JWTHandler.verify_token
+VERIFY_CACHE_MAX_SIZE = 10_000
+
+
+class Claims(TypedDict):
+    """Identity claims extracted from a verified token."""
+
+    user_id: str
+    email: Optional[str]
+    exp: int
+    iat: int
+
+
 class JWTHandler:
     """Handle JWT token creation and validation."""
 
+    __slots__ = (
+        "secret_key",
+        "algorithm",
+        "access_token_expire_minutes",
+        "refresh_token_expire_days",
+        "_access_ttl_s",
+        "_refresh_ttl_s",
+        "_reset_ttl_s",
+        "_verify_cache",
+    )
+
     def __init__(self):
         # Use settings from env_config which has proper defaults and validation
         self.secret_key = settings.JWT_SECRET_KEY
@@ -20,6 +44,11 @@ class JWTHandler:
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
 
+        # Token lifetimes in seconds; exp/iat are encoded as NumericDate ints
+        self._access_ttl_s = self.access_token_expire_minutes * 60
+        self._refresh_ttl_s = self.refresh_token_expire_days * 24 * 60 * 60
+        self._reset_ttl_s = 60 * 60
+
         # Validate that required values are set
         if not self.secret_key:
             raise ValueError(
@@ -30,6 +59,9 @@ class JWTHandler:
                 "JWT_ALGORITHM is required but not set in environment variables"
             )
 
+        # Decoded payloads keyed by token, valid until the token's exp claim
+        self._verify_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """
         Create JWT access token.
@@ -41,8 +73,8 @@ class JWTHandler:
             JWT token string
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+        now = int(time.time())
+        to_encode.update({"exp": now + self._access_ttl_s, "iat": now})
 
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
@@ -60,13 +92,24 @@ class JWTHandler:
         Raises:
             HTTPException: If token is invalid or expired
         """
-        try:
-            # Remove 'Bearer ' prefix if present
-            if token.startswith("Bearer "):
-                token = token[7:]
+        # Remove 'Bearer ' prefix if present
+        if token.startswith("Bearer "):
+            token = token[7:]
 
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+        # Serve repeat verifications of a still-valid token from the cache
+        cached = self._verify_cache.get(token)
+        if cached is not None:
+            if cached[0] > time.time():
+                return dict(cached[1])
+            self._verify_cache.pop(token, None)
+
+        try:
+            payload = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+                options={"require": ["exp", "iat"]},
+            )
 
         except ExpiredSignatureError:
             raise HTTPException(
@@ -74,22 +117,46 @@ class JWTHandler:
                 detail="Token has expired",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        except JWTError:
+        except InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    def get_user_id_from_token(self, token: str) -> str:
+        self._cache_payload(token, payload)
+        return payload
+
+    def _cache_payload(self, token: str, payload: Dict[str, Any]) -> None:
         """
-        Extract user ID from JWT token.
+        Store a verified token payload until its expiry.
+
+        Args:
+            token: JWT token string (without 'Bearer ' prefix)
+            payload: Decoded token data
+        """
+        if len(self._verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+            now = time.time()
+            for key in [k for k, (exp, _) in self._verify_cache.items() if exp <= now]:
+                self._verify_cache.pop(key, None)
+            # Still full: drop the oldest entry (dicts keep insertion order)
+            if len(self._verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+                self._verify_cache.pop(next(iter(self._verify_cache)), None)
+
+        self._verify_cache[token] = (float(payload["exp"]), dict(payload))
+
+    def extract_claims(self, token: str) -> Claims:
+        """
+        Verify a JWT token once and extract its identity claims.
 
         Args:
             token: JWT token string
 
         Returns:
-            User ID from token
+            Claims with user_id, email, exp and iat
+
+        Raises:
+            HTTPException: If token is invalid, expired or has no user_id
         """
         payload = self.verify_token(token)
         user_id = payload.get("user_id")
@@ -98,22 +165,43 @@ class JWTHandler:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token: no user_id found",
+                headers={"WWW-Authenticate": "Bearer"},
             )
 
-        return user_id
+        return Claims(
+            user_id=user_id,
+            email=payload.get("email"),
+            exp=payload["exp"],
+            iat=payload["iat"],
+        )
+
+    def get_user_id_from_token(self, token: str) -> str:
+        """
+        Extract user ID from JWT token.
+
+        Deprecated: use extract_claims() to read several claims from one decode.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            User ID from token
+        """
+        return self.extract_claims(token)["user_id"]
 
     def get_user_email_from_token(self, token: str) -> str:
         """
         Extract user email from JWT token.
 
+        Deprecated: use extract_claims() to read several claims from one decode.
+
         Args:
             token: JWT token string
 
         Returns:
             User email from token
         """
-        payload = self.verify_token(token)
-        email = payload.get("email")
+        email = self.extract_claims(token)["email"]
 
         if not email:
             raise HTTPException(
@@ -134,8 +222,8 @@ class JWTHandler:
             JWT refresh token string
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=self.refresh_token_expire_days)
-        to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "refresh"})
+        now = int(time.time())
+        to_encode.update({"exp": now + self._refresh_ttl_s, "iat": now, "type": "refresh"})
 
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
@@ -151,8 +239,8 @@ class JWTHandler:
             JWT password reset token string
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(hours=1)
-        to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "password_reset"})
+        now = int(time.time())
+        to_encode.update({"exp": now + self._reset_ttl_s, "iat": now, "type": "password_reset"})
 
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
@@ -175,7 +263,12 @@ class JWTHandler:
             if token.startswith("Bearer "):
                 token = token[7:]
 
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+                options={"require": ["exp", "iat"]},
+            )
 
             # Verify this is a refresh token
             token_type = payload.get("type")
@@ -194,7 +287,7 @@ class JWTHandler:
                 detail="Refresh token has expired",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        except JWTError:
+        except InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate refresh token",
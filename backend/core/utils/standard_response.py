@@ -1,8 +1,18 @@
+from typing import Any
+
+import orjson
 from fastapi.responses import JSONResponse
 
 from core.utils import constant_variable
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class StandardResponse:
     """This class is universal to return standard API responses
 
@@ -48,7 +58,7 @@ class StandardResponse:
     def make(self) -> JSONResponse:
         self.status = (
             constant_variable.STATUS_SUCCESS
-            if self.status_code in [201, 200]
+            if self.status_code in (201, 200)
             else constant_variable.STATUS_FAIL
         )
 
@@ -57,7 +67,7 @@ class StandardResponse:
             content["pagination"] = self.pagination
         if self.errors is not None:
             content["errors"] = self.errors
-        response = JSONResponse(content=content, status_code=self.status_code)
+        response = FastJSONResponse(content=content, status_code=self.status_code)
 
         # Set cookies
         for key, value in self.cookies.items():
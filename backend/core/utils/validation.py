@@ -12,5 +12,8 @@ def validate_data(schema_class: Any, data: dict) -> tuple[bool, Any, str]:
         validated_data = schema_class(**data)
         return True, validated_data, ""
     except ValidationError as e:
-        error_message = "; ".join([f"{err['loc'][0]}: {err['msg']}" for err in e.errors()])
+        errors = e.errors(include_url=False, include_input=False, include_context=False)
+        error_message = "; ".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in errors
+        )
         return False, None, error_message
@@ -1,5 +1,9 @@
 """
 System logger.
+
+Pass format arguments separately so the message is only built when the level
+is enabled, e.g. ``log_debug("user %s did %s", user_id, action)`` rather than
+a pre-formatted f-string.
 """
 
 import logging
@@ -8,21 +12,25 @@ from config.logging_config import setup_logging
 logger = setup_logging()
 
 
-def log_info(message: str):
+def log_info(message: str, *args):
     """Log info message."""
-    logger.info(message)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args)
 
 
-def log_error(message: str, exc_info: bool = False):
+def log_error(message: str, *args, exc_info: bool = False):
     """Log error message."""
-    logger.error(message, exc_info=exc_info)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(message, *args, exc_info=exc_info)
 
 
-def log_warning(message: str):
+def log_warning(message: str, *args):
     """Log warning message."""
-    logger.warning(message)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, *args)
 
 
-def log_debug(message: str):
+def log_debug(message: str, *args):
     """Log debug message."""
-    logger.debug(message)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args)
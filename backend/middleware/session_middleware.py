@@ -5,7 +5,7 @@ Session middleware.
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from fastapi import Response
-import uuid
+import secrets
 
 
 class SessionMiddleware(BaseHTTPMiddleware):
@@ -16,7 +16,7 @@ class SessionMiddleware(BaseHTTPMiddleware):
         session_id = request.cookies.get("session_id")
 
         if not session_id:
-            session_id = str(uuid.uuid4())
+            session_id = secrets.token_hex(16)
 
         request.state.session_id = session_id
 
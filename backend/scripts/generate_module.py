@@ -11,661 +11,188 @@ This script creates a complete module structure following the project's patterns
 - services/ (Business logic services)
 """
 
+import argparse
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Final, List, Tuple, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.environment import TemplateStream
+
+# Templates are compiled once per process and kept in memory
+_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "templates"),
+    autoescape=False,
+    auto_reload=False,
+    cache_size=-1,
+    keep_trailing_newline=True,
+    # Compiled templates persist across runs in a per-user temp directory
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+# Resolved once at import instead of on every get_project_root call
+_PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+_API_PATH: Path = _PROJECT_ROOT / "apps" / "v1" / "api"
+
+# Runs of hyphens and whitespace that to_snake_case collapses into one "_"
+_SNAKE_RE = re.compile(r"[-\s]+")
+
+# Closing message, filled in with str.format_map
+_SUMMARY_TMPL: Final[str] = """
+✅ Module '{module_name}' boilerplate generated successfully!
+
+📝 Next steps:
+   1. Review and customize the generated files
+   2. Update the model in models/model.py with your specific fields
+   3. Update schemas in schema.py with your specific fields
+   4. Register the router in apps/server.py:
+      from apps.v1.api.{module_name}.view import router as {module_name}_router
+      app.include_router(
+          {module_name}_router,
+          prefix=f"/api{{constant_variable.API_V1_PREFIX}}/{module_name}",
+          tags=["{module_name}"],
+      )
+   5. Create and run database migration for the new model
+"""
+
+# (template, output path relative to the module) for each generated source file
+_GENERATORS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("schema.py.j2", "schema.py"),  # Pydantic schemas
+    ("serializer.py.j2", "serializer.py"),  # Marshmallow serializers
+    ("model.py.j2", "models/model.py"),  # SQLAlchemy model
+    ("method.py.j2", "models/method.py"),  # CRUD base methods
+    ("async_method.py.j2", "models/methods/get_{module_name}_method.py"),
+    ("service.py.j2", "services/create_{module_name}_service.py"),
+    ("view.py.j2", "view.py"),  # FastAPI routes
+)
+
+# Files queued by write_file, written together by _flush_pending
+_PENDING: List[Tuple[Path, Union[str, TemplateStream]]] = []
+
+
+@dataclass(frozen=True, slots=True)
+class Names:
+    """Case variants of a module name, derived once per generation run."""
+
+    snake: str
+    pascal: str
 
 
 def get_project_root() -> Path:
     """Get the project root directory."""
-    current_file = Path(__file__).resolve()
-    return current_file.parent.parent
+    return _PROJECT_ROOT
 
 
+@lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
     """Convert string to snake_case."""
-    return name.lower().replace("-", "_").replace(" ", "_")
+    return _SNAKE_RE.sub("_", name).lower()
 
 
+@lru_cache(maxsize=256)
 def to_pascal_case(name: str) -> str:
     """Convert string to PascalCase."""
-    return "".join(word.capitalize() for word in to_snake_case(name).split("_"))
+    return to_snake_case(name).title().replace("_", "")
 
 
+@lru_cache(maxsize=256)
 def to_camel_case(name: str) -> str:
     """Convert string to camelCase."""
-    words = to_snake_case(name).split("_")
-    return words[0] + "".join(word.capitalize() for word in words[1:])
+    pascal = to_pascal_case(name)
+    return pascal[:1].lower() + pascal[1:]
 
 
-def create_directory(path: Path) -> None:
-    """Create directory if it doesn't exist."""
+def create_directory(path: Path) -> str:
+    """Create directory if it doesn't exist and return its status line."""
     path.mkdir(parents=True, exist_ok=True)
-    print(f"✓ Created directory: {path}")
-
-
-def write_file(file_path: Path, content: str) -> None:
-    """Write content to file."""
-    file_path.write_text(content, encoding="utf-8")
-    print(f"✓ Created file: {file_path}")
-
-
-def generate_init_file(module_path: Path) -> None:
-    """Generate __init__.py file."""
-    content = ""
-    write_file(module_path / "__init__.py", content)
-
-
-def generate_schema_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate schema.py file with Pydantic schemas."""
-    content = f'''"""
-Pydantic schemas for {module_name} module.
-"""
-
-from typing import Optional
-from pydantic import BaseModel, Field
-
-
-class {pascal_name}CreateSchema(BaseModel):
-    """Schema for creating {module_name}."""
-
-    name: str = Field(..., description="{pascal_name} name")
-    # Add more fields as needed
-
-
-class {pascal_name}UpdateSchema(BaseModel):
-    """Schema for updating {module_name}."""
-
-    name: Optional[str] = Field(None, description="{pascal_name} name")
-    # Add more fields as needed
-
-
-class {pascal_name}ResponseSchema(BaseModel):
-    """Schema for {module_name} response."""
-
-    id: int = Field(..., description="{pascal_name} ID")
-    name: str = Field(..., description="{pascal_name} name")
-    created_at: str = Field(..., description="Creation timestamp")
-    updated_at: str = Field(..., description="Update timestamp")
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-'''
-    write_file(module_path / "schema.py", content)
-
-
-def generate_serializer_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate serializer.py file with Marshmallow serializers."""
-    content = f'''"""
-Marshmallow serializer for {module_name} module.
-"""
-
-from apps.v1.api.{module_name}.models.model import {pascal_name}
-from marshmallow import Schema, fields
-
-
-class {pascal_name}Serializer(Schema):
-    """Serializer for {pascal_name} model."""
-
-    id = fields.Int(required=True)
-    name = fields.Str(required=True)
-    created_at = fields.DateTime(required=True)
-    updated_at = fields.DateTime(required=True)
-'''
-    write_file(module_path / "serializer.py", content)
-
-
-def generate_model_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate model.py file with SQLAlchemy model."""
-    content = f'''"""
-SQLAlchemy model for {module_name} module.
-"""
-
-from config.db_config import Base
-from core.db.mixins.timestamp_mixin import TimestampMixin
-from sqlalchemy import Column, Integer, String
-
-
-class {pascal_name}(Base, TimestampMixin):
-    """
-    {pascal_name} model.
-
-    Represents a {module_name} entity in the database.
-    """
-
-    __tablename__ = "{module_name}"
-
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False, index=True)
-    # Add more columns as needed
-'''
-    write_file(module_path / "models" / "model.py", content)
-
-
-def generate_method_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate method.py file with CRUD base methods."""
-    content = f'''"""
-CRUD methods for {module_name} module.
-"""
-
-from apps.v1.api.{module_name}.models.model import {pascal_name}
-from core.utils.db_method import CRUDBase
-
-
-class {pascal_name}Method(CRUDBase[{pascal_name}]):
-    """Methods for {module_name} module."""
-
-    def get_{module_name}_by_name(self, db, name: str) -> {pascal_name}:
-        """Get {module_name} by name."""
-        return db.query({pascal_name}).filter({pascal_name}.name == name).first()
-'''
-    write_file(module_path / "models" / "method.py", content)
-
-
-def generate_async_method_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate async database method file."""
-    content = f'''"""
-Database methods for {module_name} operations.
-"""
-
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
-
-from apps.v1.api.{module_name}.models.model import {pascal_name}
-
-
-async def get_{module_name}_by_id(
-    db: AsyncSession,
-    {module_name}_id: int,
-) -> Optional[{pascal_name}]:
-    """
-    Get {module_name} by ID.
-
-    Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-
-    Returns:
-        {pascal_name} object if found, None otherwise
-    """
-    stmt = select({pascal_name}).where({pascal_name}.id == {module_name}_id).limit(1)
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return f"✓ Created directory: {path}"
 
 
-async def get_{module_name}_by_name(
-    db: AsyncSession,
-    name: str,
-) -> Optional[{pascal_name}]:
-    """
-    Get {module_name} by name.
+def write_file(file_path: Path, content: Union[str, TemplateStream]) -> None:
+    """Queue a string or template stream to be written to file by _flush_pending."""
+    _PENDING.append((file_path, content))
 
-    Args:
-        db: Async database session
-        name: {pascal_name} name
 
-    Returns:
-        {pascal_name} object if found, None otherwise
-    """
-    stmt = select({pascal_name}).where({pascal_name}.name == name).limit(1)
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+def _write_pending(item: Tuple[Path, Union[str, TemplateStream]]) -> str:
+    """Write one queued file as UTF-8 bytes and return its status line."""
+    file_path, content = item
+    if isinstance(content, TemplateStream):
+        # Rendered chunks are encoded and written as they are produced
+        content.dump(str(file_path), encoding="utf-8")
+    elif not content:
+        # Empty files (e.g. __init__.py) only need creating, not a write
+        os.close(os.open(file_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+    else:
+        file_path.write_bytes(content.encode("utf-8"))
+    return f"✓ Created file: {file_path}"
 
 
-async def create_{module_name}(
-    db: AsyncSession,
-    {module_name}_data: dict,
-) -> {pascal_name}:
-    """
-    Create a new {module_name} in the database.
-
-    Args:
-        db: Async database session
-        {module_name}_data: Dictionary containing {module_name} data
-
-    Returns:
-        Created {pascal_name} object
-    """
-    new_{module_name} = {pascal_name}(**{module_name}_data)
-    db.add(new_{module_name})
-    await db.commit()
-    await db.refresh(new_{module_name})
-    return new_{module_name}
-
-
-async def update_{module_name}(
-    db: AsyncSession,
-    {module_name}_id: int,
-    {module_name}_data: dict,
-) -> Optional[{pascal_name}]:
+def _flush_pending(live: bool = False) -> List[str]:
     """
-    Update {module_name} in the database.
+    Write all queued files concurrently and return their status lines.
 
     Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-        {module_name}_data: Dictionary containing updated {module_name} data
-
-    Returns:
-        Updated {pascal_name} object if found, None otherwise
-    """
-    {module_name} = await get_{module_name}_by_id(db=db, {module_name}_id={module_name}_id)
-    if not {module_name}:
-        return None
-
-    for key, value in {module_name}_data.items():
-        setattr({module_name}, key, value)
-
-    await db.commit()
-    await db.refresh({module_name})
-    return {module_name}
-
-
-async def delete_{module_name}(
-    db: AsyncSession,
-    {module_name}_id: int,
-) -> bool:
-    """
-    Delete {module_name} from the database.
-
-    Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-
-    Returns:
-        True if deleted, False otherwise
+        live: Also print each status line as soon as its file is written
     """
-    {module_name} = await get_{module_name}_by_id(db=db, {module_name}_id={module_name}_id)
-    if not {module_name}:
-        return False
+    messages = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # map yields in submission order, so the report follows the queue order
+        for message in executor.map(_write_pending, _PENDING):
+            if live:
+                print(message, flush=True)
+            messages.append(message)
+    _PENDING.clear()
+    return messages
 
-    await db.delete({module_name})
-    await db.commit()
-    return True
-'''
-    write_file(module_path / "models" / "methods" / f"get_{module_name}_method.py", content)
 
-
-def generate_service_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate service file with business logic."""
-    content = f'''"""
-Service for {module_name} operations.
-"""
-
-import logging
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from apps.v1.api.{module_name}.models.methods.get_{module_name}_method import (
-    create_{module_name},
-    get_{module_name}_by_id,
-    get_{module_name}_by_name,
-    update_{module_name},
-    delete_{module_name},
-)
-from apps.v1.api.{module_name}.schema import (
-    {pascal_name}CreateSchema,
-    {pascal_name}UpdateSchema,
-)
-from core.utils import constant_variable, message_variable
-from core.utils.standard_response import StandardResponse
-
-logger = logging.getLogger(__name__)
-
-
-async def create_{module_name}_service(
-    db: AsyncSession,
-    {module_name}_data: {pascal_name}CreateSchema,
-) -> StandardResponse:
-    """
-    Create a new {module_name}.
-
-    Args:
-        db: Async database session
-        {module_name}_data: {pascal_name}CreateSchema containing {module_name} data
-
-    Returns:
-        StandardResponse with created {module_name} data or error message
-    """
-    logger.info(f"Creating {module_name}: {{str({module_name}_data)}}")
-
-    try:
-        # Check if {module_name} already exists
-        existing_{module_name} = await get_{module_name}_by_name(
-            db=db,
-            name={module_name}_data.name,
-        )
-
-        if existing_{module_name}:
-            logger.warning(f"{pascal_name} with name {{str({module_name}_data.name)}} already exists")
-            return StandardResponse(
-                status=constant_variable.STATUS_FAIL,
-                status_code=constant_variable.HTTP_400_BAD_REQUEST,
-                data=constant_variable.STATUS_NULL,
-                message=f"{pascal_name} with this name already exists",
-            )
-
-        # Create {module_name}
-        {module_name}_dict = {module_name}_data.model_dump()
-        new_{module_name} = await create_{module_name}(
-            db=db,
-            {module_name}_data={module_name}_dict,
-        )
-
-        logger.info(f"{pascal_name} created successfully with ID: {{new_{module_name}.id}}")
-
-        return StandardResponse(
-            status=constant_variable.STATUS_SUCCESS,
-            status_code=constant_variable.HTTP_201_CREATED,
-            data={{"id": new_{module_name}.id, "name": new_{module_name}.name}},
-            message=f"{pascal_name} created successfully",
-        )
-
-    except Exception as exc:
-        logger.error(f"Error creating {module_name}: {{str(exc)}}", exc_info=True)
-        return StandardResponse(
-            status=constant_variable.STATUS_FAIL,
-            status_code=constant_variable.HTTP_500_INTERNAL_SERVER_ERROR,
-            data=constant_variable.STATUS_NULL,
-            message=message_variable.SOMETHING_WENT_WRONG,
-        )
-
-
-async def get_{module_name}_service(
-    db: AsyncSession,
-    {module_name}_id: int,
-) -> StandardResponse:
-    """
-    Get {module_name} by ID.
-
-    Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-
-    Returns:
-        StandardResponse with {module_name} data or error message
-    """
-    logger.info(f"Fetching {module_name} with ID: {{str({module_name}_id)}}")
-
-    try:
-        {module_name} = await get_{module_name}_by_id(db=db, {module_name}_id={module_name}_id)
-
-        if not {module_name}:
-            logger.warning(f"{pascal_name} with ID {{str({module_name}_id)}} not found")
-            return StandardResponse(
-                status=constant_variable.STATUS_FAIL,
-                status_code=constant_variable.HTTP_404_NOT_FOUND,
-                data=constant_variable.STATUS_NULL,
-                message=f"{pascal_name} not found",
-            )
-
-        return StandardResponse(
-            status=constant_variable.STATUS_SUCCESS,
-            status_code=constant_variable.HTTP_200_OK,
-            data={{"id": {module_name}.id, "name": {module_name}.name}},
-            message=f"{pascal_name} retrieved successfully",
-        )
-
-    except Exception as exc:
-        logger.error(f"Error fetching {module_name}: {{str(exc)}}", exc_info=True)
-        return StandardResponse(
-            status=constant_variable.STATUS_FAIL,
-            status_code=constant_variable.HTTP_500_INTERNAL_SERVER_ERROR,
-            data=constant_variable.STATUS_NULL,
-            message=message_variable.SOMETHING_WENT_WRONG,
-        )
-
-
-async def update_{module_name}_service(
-    db: AsyncSession,
-    {module_name}_id: int,
-    {module_name}_data: {pascal_name}UpdateSchema,
-) -> StandardResponse:
-    """
-    Update {module_name}.
-
-    Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-        {module_name}_data: {pascal_name}UpdateSchema containing updated {module_name} data
-
-    Returns:
-        StandardResponse with updated {module_name} data or error message
-    """
-    logger.info(f"Updating {module_name} with ID: {{str({module_name}_id)}}")
-
-    try:
-        {module_name} = await update_{module_name}(
-            db=db,
-            {module_name}_id={module_name}_id,
-            {module_name}_data={module_name}_data.model_dump(exclude_unset=True),
-        )
-
-        if not {module_name}:
-            logger.warning(f"{pascal_name} with ID {{str({module_name}_id)}} not found")
-            return StandardResponse(
-                status=constant_variable.STATUS_FAIL,
-                status_code=constant_variable.HTTP_404_NOT_FOUND,
-                data=constant_variable.STATUS_NULL,
-                message=f"{pascal_name} not found",
-            )
-
-        logger.info(f"{pascal_name} updated successfully with ID: {{str({module_name}_id)}}")
-
-        return StandardResponse(
-            status=constant_variable.STATUS_SUCCESS,
-            status_code=constant_variable.HTTP_200_OK,
-            data={{"id": {module_name}.id, "name": {module_name}.name}},
-            message=f"{pascal_name} updated successfully",
-        )
-
-    except Exception as exc:
-        logger.error(f"Error updating {module_name}: {{str(exc)}}", exc_info=True)
-        return StandardResponse(
-            status=constant_variable.STATUS_FAIL,
-            status_code=constant_variable.HTTP_500_INTERNAL_SERVER_ERROR,
-            data=constant_variable.STATUS_NULL,
-            message=message_variable.SOMETHING_WENT_WRONG,
-        )
-
-
-async def delete_{module_name}_service(
-    db: AsyncSession,
-    {module_name}_id: int,
-) -> StandardResponse:
-    """
-    Delete {module_name}.
-
-    Args:
-        db: Async database session
-        {module_name}_id: {pascal_name} ID
-
-    Returns:
-        StandardResponse with success or error message
-    """
-    logger.info(f"Deleting {module_name} with ID: {{str({module_name}_id)}}")
-
-    try:
-        deleted = await delete_{module_name}(db=db, {module_name}_id={module_name}_id)
-
-        if not deleted:
-            logger.warning(f"{pascal_name} with ID {{str({module_name}_id)}} not found")
-            return StandardResponse(
-                status=constant_variable.STATUS_FAIL,
-                status_code=constant_variable.HTTP_404_NOT_FOUND,
-                data=constant_variable.STATUS_NULL,
-                message=f"{pascal_name} not found",
-            )
-
-        logger.info(f"{pascal_name} deleted successfully with ID: {{str({module_name}_id)}}")
-
-        return StandardResponse(
-            status=constant_variable.STATUS_SUCCESS,
-            status_code=constant_variable.HTTP_200_OK,
-            data=constant_variable.STATUS_NULL,
-            message=f"{pascal_name} deleted successfully",
-        )
-
-    except Exception as exc:
-        logger.error(f"Error deleting {module_name}: {{str(exc)}}", exc_info=True)
-        return StandardResponse(
-            status=constant_variable.STATUS_FAIL,
-            status_code=constant_variable.HTTP_500_INTERNAL_SERVER_ERROR,
-            data=constant_variable.STATUS_NULL,
-            message=message_variable.SOMETHING_WENT_WRONG,
-        )
-'''
-    write_file(module_path / "services" / f"create_{module_name}_service.py", content)
-
-
-def generate_view_file(module_path: Path, module_name: str, pascal_name: str) -> None:
-    """Generate view.py file with FastAPI routes."""
-    content = f'''"""
-View for {module_name} operations.
-"""
-
-import logging
-
-from fastapi import APIRouter, Depends, Path
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from apps.v1.api.{module_name}.schema import (
-    {pascal_name}CreateSchema,
-    {pascal_name}UpdateSchema,
-)
-from apps.v1.api.{module_name}.services.create_{module_name}_service import (
-    create_{module_name}_service,
-    get_{module_name}_service,
-    update_{module_name}_service,
-    delete_{module_name}_service,
-)
-from config.db_config import get_async_db
-
-logger = logging.getLogger(__name__)
-
-router = APIRouter()
-
-
-@router.post("/")
-async def create_{module_name}(
-    {module_name}_data: {pascal_name}CreateSchema,
-    db: AsyncSession = Depends(get_async_db),
-):
-    """
-    Create a new {module_name}.
-
-    Args:
-        {module_name}_data: {pascal_name}CreateSchema containing {module_name} data
-        db: Async database session
-
-    Returns:
-        StandardResponse with created {module_name} data or error message
-    """
-    logger.info(f"Creating {module_name}: {{str({module_name}_data)}}")
-    response = await create_{module_name}_service(db=db, {module_name}_data={module_name}_data)
-    return response.make
-
-
-@router.get("/{{module_id}}")
-async def get_{module_name}(
-    module_id: int = Path(..., description="{pascal_name} ID"),
-    db: AsyncSession = Depends(get_async_db),
-):
-    """
-    Get {module_name} by ID.
-
-    Args:
-        module_id: {pascal_name} ID
-        db: Async database session
-
-    Returns:
-        StandardResponse with {module_name} data or error message
-    """
-    logger.info(f"Fetching {module_name} with ID: {{str(module_id)}}")
-    response = await get_{module_name}_service(db=db, {module_name}_id=module_id)
-    return response.make
-
-
-@router.put("/{{module_id}}")
-async def update_{module_name}(
-    {module_name}_data: {pascal_name}UpdateSchema,
-    module_id: int = Path(..., description="{pascal_name} ID"),
-    db: AsyncSession = Depends(get_async_db),
-):
-    """
-    Update {module_name}.
-
-    Args:
-        module_id: {pascal_name} ID
-        {module_name}_data: {pascal_name}UpdateSchema containing updated {module_name} data
-        db: Async database session
-
-    Returns:
-        StandardResponse with updated {module_name} data or error message
-    """
-    logger.info(f"Updating {module_name} with ID: {{str(module_id)}}")
-    response = await update_{module_name}_service(
-        db=db,
-        {module_name}_id=module_id,
-        {module_name}_data={module_name}_data,
-    )
-    return response.make
-
-
-@router.delete("/{{module_id}}")
-async def delete_{module_name}(
-    module_id: int = Path(..., description="{pascal_name} ID"),
-    db: AsyncSession = Depends(get_async_db),
-):
-    """
-    Delete {module_name}.
-
-    Args:
-        module_id: {pascal_name} ID
-        db: Async database session
-
-    Returns:
-        StandardResponse with success or error message
-    """
-    logger.info(f"Deleting {module_name} with ID: {{str(module_id)}}")
-    response = await delete_{module_name}_service(db=db, {module_name}_id=module_id)
-    return response.make
-'''
-    write_file(module_path / "view.py", content)
+def generate_init_file(module_path: Path) -> None:
+    """Generate empty __init__.py file."""
+    write_file(module_path / "__init__.py", "")
 
 
-def generate_module_boilerplate(module_name: str) -> None:
+def generate_module_boilerplate(module_name: str, quiet: bool = False, live: bool = False) -> None:
     """
     Generate complete module boilerplate.
 
     Args:
         module_name: Name of the module to create (e.g., 'student', 'course', 'teacher')
+        quiet: Skip the per-directory and per-file status lines
+        live: Print status lines as they happen instead of in one write at the end
     """
-    project_root = get_project_root()
-    api_path = project_root / "apps" / "v1" / "api"
-
     # Normalize module name
     module_name = to_snake_case(module_name)
-    pascal_name = to_pascal_case(module_name)
+    names = Names(
+        snake=module_name,
+        pascal=to_pascal_case(module_name),
+    )
 
-    # Check if module already exists
-    module_path = api_path / module_name
-    if module_path.exists():
+    # Creating the module directory doubles as the existence check
+    module_path = _API_PATH / module_name
+    try:
+        module_path.mkdir(parents=True, exist_ok=False)
+    except FileExistsError:
         print(f"❌ Error: Module '{module_name}' already exists at {module_path}")
         sys.exit(1)
 
-    print(f"\n🚀 Generating boilerplate for module: {module_name}")
-    print(f"   PascalCase name: {pascal_name}")
-    print(f"   Location: {module_path}\n")
+    sys.stdout.write(
+        f"\n🚀 Generating boilerplate for module: {module_name}\n"
+        f"   PascalCase name: {names.pascal}\n"
+        f"   Location: {module_path}\n\n"
+    )
 
-    # Create directory structure
-    create_directory(module_path)
-    create_directory(module_path / "models")
-    create_directory(module_path / "models" / "methods")
-    create_directory(module_path / "services")
+    # Create directory structure (parents=True also creates models)
+    created = [
+        create_directory(module_path / "models" / "methods"),
+        create_directory(module_path / "services"),
+    ]
+    live = live and not quiet
+    if live:
+        print("\n".join(created), flush=True)
 
     # Generate files
     generate_init_file(module_path)
@@ -673,39 +200,38 @@ def generate_module_boilerplate(module_name: str) -> None:
     generate_init_file(module_path / "models" / "methods")
     generate_init_file(module_path / "services")
 
-    generate_schema_file(module_path, module_name, pascal_name)
-    generate_serializer_file(module_path, module_name, pascal_name)
-    generate_model_file(module_path, module_name, pascal_name)
-    generate_method_file(module_path, module_name, pascal_name)
-    generate_async_method_file(module_path, module_name, pascal_name)
-    generate_service_file(module_path, module_name, pascal_name)
-    generate_view_file(module_path, module_name, pascal_name)
-
-    print(f"\n✅ Module '{module_name}' boilerplate generated successfully!")
-    print(f"\n📝 Next steps:")
-    print(f"   1. Review and customize the generated files")
-    print(f"   2. Update the model in models/model.py with your specific fields")
-    print(f"   3. Update schemas in schema.py with your specific fields")
-    print(f"   4. Register the router in apps/server.py:")
-    print(f"      from apps.v1.api.{module_name}.view import router as {module_name}_router")
-    print(f"      app.include_router(")
-    print(f"          {module_name}_router,")
-    print(f"          prefix=f\"/api{{constant_variable.API_V1_PREFIX}}/{module_name}\",")
-    print(f"          tags=[\"{module_name}\"],")
-    print(f"      )")
-    print(f"   5. Create and run database migration for the new model")
+    # Streams render lazily, so templates are rendered by _flush_pending's workers
+    for template_name, relpath in _GENERATORS:
+        template = _ENV.get_template(template_name)
+        write_file(module_path / relpath.format(module_name=names.snake), template.stream(n=names))
+    created.extend(_flush_pending(live=live))
+    if not quiet and not live:
+        sys.stdout.write("\n".join(created) + "\n")
+
+    sys.stdout.write(_SUMMARY_TMPL.format_map({"module_name": names.snake}))
 
 
 def main() -> None:
     """Main entry point for the script."""
-    if len(sys.argv) < 2:
-        print("Usage: python generate_module.py <module_name>")
-        print("Example: python generate_module.py student")
-        print("Example: python generate_module.py course-management")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Generate module boilerplate for the LMS backend.",
+        epilog=(
+            "Example: python generate_module.py student\n"
+            "Example: python generate_module.py course-management"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("module_name", help="Name of the module to create")
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Do not list each created directory and file",
+    )
+    args = parser.parse_args()
 
-    module_name = sys.argv[1]
-    generate_module_boilerplate(module_name)
+    # Terminals get live progress; pipes and CI logs get one batched write
+    generate_module_boilerplate(args.module_name, quiet=args.quiet, live=sys.stdout.isatty())
 
 
 if __name__ == "__main__":